@@ -6,12 +6,20 @@ Supports both static and dynamic content, with automatic crawling capabilities.
 
 import os
 import re
+import atexit
+import asyncio
 import time
 import json
+import shutil
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urljoin, urlparse, urlunparse, urldefrag
 
+import httpx
 import requests
 from requests.adapters import HTTPAdapter, Retry
+from requests_cache import CachedSession
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 
@@ -20,9 +28,14 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 
+# url(...) references inside stylesheets; the negated class keeps matching linear
+_CSS_URL_RE = re.compile(rb"url\(['\"]?([^'\")]+)['\"]?\)")
+# Inline URL schemes that never point at a downloadable asset
+_INLINE_PREFIXES = ("data:", "javascript:")
+
 # ---------- Basic utilities ----------
 
-def setup_session(retries=3, backoff_factor=0.3, status_forcelist=(500,502,504), user_agent=None):
+def setup_session(retries=3, backoff_factor=0.3, status_forcelist=(500,502,504), user_agent=None, cache_dir=None, pool_size=32):
     """
     Set up a requests session with retry capabilities and custom user agent.
     
@@ -31,24 +44,44 @@ def setup_session(retries=3, backoff_factor=0.3, status_forcelist=(500,502,504),
         backoff_factor (float): Time to wait between retries
         status_forcelist (tuple): HTTP status codes to retry on
         user_agent (str): Custom user agent string
+        cache_dir (str): If given, keep an on-disk HTTP cache here that
+            honours Cache-Control/ETag and is reused across runs; responses
+            without caching headers are kept for an hour. Cached bodies are
+            read fully into memory, so streamed downloads are not constant-memory
+        pool_size (int): Connections kept alive per host; should be at least
+            the number of download workers or urllib3 discards the extras
     
     Returns:
         requests.Session: Configured session object
     """
-    session = requests.Session()
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        session = CachedSession(
+            cache_name=os.path.join(cache_dir, ".http_cache"),
+            backend="sqlite",
+            cache_control=True,
+            expire_after=3600
+        )
+    else:
+        session = requests.Session()
     ua = user_agent or (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/114.0.0.0 Safari/537.36"
     )
-    session.headers.update({'User-Agent': ua})
+    session.headers.update({'User-Agent': ua, 'Connection': 'keep-alive'})
     retry = Retry(
         total=retries,
         backoff_factor=backoff_factor,
         status_forcelist=status_forcelist,
         allowed_methods=["GET"]
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry,
+        pool_block=False
+    )
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     return session
@@ -73,7 +106,7 @@ def categorize_asset(path):
 
 def make_local_path(base_dir, asset_url, base_url):
     """
-    Create a local path for an asset URL.
+    Build the local path for an asset URL (does not touch the filesystem).
     
     Args:
         base_dir (str): Base directory for saving files
@@ -90,7 +123,6 @@ def make_local_path(base_dir, asset_url, base_url):
     rel_path = os.path.normpath(parsed.path.lstrip('/'))
     category = categorize_asset(rel_path)
     local_path = os.path.join(base_dir, category, rel_path)
-    os.makedirs(os.path.dirname(local_path), exist_ok=True)
     return local_path, asset_url
 
 
@@ -102,56 +134,258 @@ def download_asset(session, url, local_path, delay):
         session (requests.Session): Session object
         url (str): URL of the asset
         local_path (str): Local path to save the asset
-        delay (float): Delay between downloads
+        delay (float): Pause after the download, throttling the calling worker
     
     Returns:
         bool: True if download was successful
     """
+    # Write to a side file and swap it in, so a hard link shared with an
+    # earlier page is replaced rather than rewritten in place
+    tmp_path = local_path + ".part"
     try:
-        resp = session.get(url, timeout=10)
-        resp.raise_for_status()
-        with open(local_path, 'wb') as f:
-            f.write(resp.content)
+        with session.get(url, timeout=10, stream=True) as resp:
+            resp.raise_for_status()
+            # iter_content decodes gzip/deflate whether the body comes from
+            # the network or was already consumed into the HTTP cache
+            with open(tmp_path, 'wb') as f:
+                for chunk in resp.iter_content(64 * 1024):
+                    f.write(chunk)
+        os.replace(tmp_path, local_path)
         time.sleep(delay)
         return True
     except Exception as e:
         print(f"❌ Error downloading {url}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
         return False
 
+
+def link_asset(src_path, local_path):
+    """
+    Reuse an already downloaded asset, hard-linking it when possible.
+    
+    Args:
+        src_path (str): Path of the existing download
+        local_path (str): Path the asset should also appear at
+    """
+    if os.path.exists(local_path):
+        os.remove(local_path)
+    try:
+        os.link(src_path, local_path)
+    except OSError:
+        shutil.copyfile(src_path, local_path)
+
+
+def fetch_css(session, url):
+    """
+    Fetch a stylesheet body for URL extraction.
+    
+    Args:
+        session (requests.Session): Session object
+        url (str): URL of the stylesheet
+    
+    Returns:
+        bytes: Raw stylesheet content, or b"" if the request failed
+    """
+    try:
+        return session.get(url, timeout=10).content
+    except Exception:
+        return b""
+
+
+def download_assets(session, assets, delay, max_workers=16):
+    """
+    Download assets in parallel threads over a shared session.
+    
+    Args:
+        session (requests.Session): Session object
+        assets (list): (url, local_path) pairs to download
+        delay (float): Pause after each download, per worker
+        max_workers (int): Number of parallel download threads
+    
+    Returns:
+        dict: Mapping of downloaded URL to local path
+    """
+    url_to_local = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = {
+            ex.submit(download_asset, session, url, local_path, delay): (url, local_path)
+            for url, local_path in assets
+        }
+        for fut in tqdm(as_completed(futures), total=len(futures), desc="Downloading assets"):
+            url, local_path = futures[fut]
+            if fut.result():
+                url_to_local[url] = local_path
+    return url_to_local
+
+
+async def _fetch_one(client, url, local_path, delay):
+    """
+    Stream one asset to disk through an httpx client.
+    
+    Args:
+        client (httpx.AsyncClient): Shared async client
+        url (str): URL of the asset
+        local_path (str): Local path to save the asset
+        delay (float): Pause after the download, throttling this task
+    
+    Returns:
+        bool: True if download was successful
+    """
+    tmp_path = local_path + ".part"
+    try:
+        async with client.stream("GET", url) as resp:
+            resp.raise_for_status()
+            with open(tmp_path, 'wb') as f:
+                async for chunk in resp.aiter_bytes(64 * 1024):
+                    f.write(chunk)
+        os.replace(tmp_path, local_path)
+        await asyncio.sleep(delay)
+        return True
+    except Exception as e:
+        print(f"❌ Error downloading {url}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+
+
+async def download_assets_async(session, assets, delay, max_connections=50):
+    """
+    Download assets concurrently with an HTTP/2 capable httpx client.
+    
+    The client lives only for this call (each page runs its own event loop
+    via asyncio.run), so HTTP/2 connections and TLS sessions are not kept
+    between crawled pages the way the shared requests session's are.
+    
+    Args:
+        session (requests.Session): Session whose headers are reused
+        assets (list): (url, local_path) pairs to download
+        delay (float): Pause after each download, per task
+        max_connections (int): Maximum number of open connections
+    
+    Returns:
+        dict: Mapping of downloaded URL to local path
+    """
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    # No pool timeout: queued tasks wait for a free connection instead of failing
+    timeout = httpx.Timeout(10, pool=None)
+    url_to_local = {}
+    async with httpx.AsyncClient(
+        timeout=timeout,
+        headers=dict(session.headers),
+        follow_redirects=True,
+        transport=httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=3)
+    ) as client:
+        async def run(url, local_path):
+            return url, local_path, await _fetch_one(client, url, local_path, delay)
+
+        tasks = [asyncio.create_task(run(url, local_path)) for url, local_path in assets]
+        for task in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="Downloading assets"):
+            url, local_path, ok = await task
+            if ok:
+                url_to_local[url] = local_path
+    return url_to_local
+
+# ---------- Shared headless browser ----------
+
+@functools.lru_cache(maxsize=1)
+def get_chromedriver_path():
+    """
+    Resolve the chromedriver binary once per process.
+    
+    The CHROMEDRIVER environment variable, if set, is used as-is so offline
+    runs skip webdriver-manager's network version check.
+    
+    Returns:
+        str: Path to the chromedriver executable
+    """
+    return os.environ.get("CHROMEDRIVER") or ChromeDriverManager().install()
+
+
+def make_chrome_options(user_agent=None):
+    """
+    Build headless Chrome options with network performance logging.
+    
+    Args:
+        user_agent (str): Custom user agent
+    
+    Returns:
+        Options: Chrome options object
+    """
+    opts = Options()
+    opts.add_argument("--headless=new")
+    opts.add_argument("--disable-gpu")
+    opts.add_argument("--no-sandbox")
+    opts.add_argument("--disable-dev-shm-usage")
+    if user_agent:
+        opts.add_argument(f"--user-agent={user_agent}")
+    opts.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True})
+    opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return opts
+
+
+class BrowserPool:
+    """
+    Lazily start a single headless Chrome and reuse it for every page.
+    
+    Use as a context manager; the browser is also closed at interpreter
+    exit in case the pool is never closed explicitly.
+    """
+
+    def __init__(self, user_agent=None):
+        self.user_agent = user_agent
+        self._driver = None
+
+    @property
+    def driver(self):
+        if self._driver is None:
+            self._driver = webdriver.Chrome(
+                service=Service(get_chromedriver_path()),
+                options=make_chrome_options(self.user_agent)
+            )
+            atexit.register(self.close)
+        return self._driver
+
+    def close(self):
+        if self._driver is not None:
+            atexit.unregister(self.close)
+            try:
+                self._driver.quit()
+            finally:
+                self._driver = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
 # ---------- Dynamic URL collector via Selenium ----------
 
-def get_dynamic_urls(page_url, wait, user_agent=None):
+def get_dynamic_urls(page_url, wait, driver):
     """
     Collect dynamic URLs using Selenium.
     
     Args:
         page_url (str): URL of the page to scrape
         wait (float): Time to wait for dynamic content
-        user_agent (str): Custom user agent
+        driver (webdriver.Chrome): Browser with performance logging enabled
     
     Returns:
         set: Set of dynamic URLs
     """
-    chrome_opts = Options()
-    chrome_opts.add_argument("--headless")
-    chrome_opts.add_argument("--disable-gpu")
-    if user_agent:
-        chrome_opts.add_argument(f"--user-agent={user_agent}")
-    chrome_opts.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True})
-    chrome_opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
-
-    driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
-        options=chrome_opts
-    )
+    # Drain entries left over from previous pages
+    driver.get_log("performance")
     driver.get(page_url)
     time.sleep(wait)
 
     logs = driver.get_log("performance")
-    driver.quit()
 
     urls = set()
     for entry in logs:
+        # Cheap substring test so only request events pay for json.loads
+        if '"Network.requestWillBeSent"' not in entry["message"]:
+            continue
         msg = json.loads(entry["message"])['message']
         if msg.get("method") == "Network.requestWillBeSent":
             u = msg["params"]["request"]["url"]
@@ -168,7 +402,13 @@ def scrape_page_combined(
     output_dir="downloaded_site",
     delay=0.5,
     wait_dynamic=2.0,
-    user_agent=None
+    user_agent=None,
+    max_workers=16,
+    session=None,
+    browser=None,
+    async_downloads=False,
+    url_cache=None,
+    use_cache=True
 ):
     """
     Scrape a web page and download all its assets.
@@ -176,11 +416,36 @@ def scrape_page_combined(
     Args:
         page_url (str): URL of the page to scrape
         output_dir (str): Directory to save downloaded files
-        delay (float): Delay between downloads
+        delay (float): Delay between downloads (per worker)
         wait_dynamic (float): Time to wait for dynamic content
         user_agent (str): Custom user agent
+        max_workers (int): Number of parallel download threads
+        session (requests.Session): Shared session to reuse (created if omitted)
+        browser (BrowserPool): Shared browser to reuse (created if omitted)
+        async_downloads (bool): Download assets with asyncio + httpx instead of threads
+        url_cache (dict): URL -> local path of assets downloaded for other pages;
+            updated in place with this page's downloads
+        use_cache (bool): Keep an HTTP cache in output_dir (ignored when a
+            session is passed in); disable for constant-memory streaming
+    
+    Returns:
+        list: Original href values of the page's <a> tags
     """
-    session = setup_session(user_agent=user_agent)
+    if browser is None:
+        with BrowserPool(user_agent=user_agent) as browser:
+            return scrape_page_combined(
+                page_url, output_dir=output_dir, delay=delay,
+                wait_dynamic=wait_dynamic, user_agent=user_agent,
+                max_workers=max_workers, session=session, browser=browser,
+                async_downloads=async_downloads, url_cache=url_cache,
+                use_cache=use_cache
+            )
+
+    session = session or setup_session(
+        user_agent=user_agent,
+        cache_dir=output_dir if use_cache else None,
+        pool_size=max(32, max_workers)
+    )
 
     # بدون توجه به robots.txt ادامه می‌دهیم
 
@@ -188,85 +453,116 @@ def scrape_page_combined(
     try:
         resp = session.get(page_url, timeout=10)
         resp.raise_for_status()
-        resp.encoding = resp.apparent_encoding
+        # Raw bytes: the parser reads the BOM / <meta charset> itself
         html = resp.content
     except requests.exceptions.HTTPError as e:
         print(f"⚠️ HTTPError {e.response.status_code}, using Selenium fallback...")
-        opts = Options()
-        opts.add_argument("--headless")
-        opts.add_argument("--disable-gpu")
-        if user_agent:
-            opts.add_argument(f"--user-agent={user_agent}")
-        opts.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True})
-        opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
-        driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
-            options=opts
-        )
+        driver = browser.driver
         driver.get(page_url)
         time.sleep(wait_dynamic)
         html = driver.page_source.encode('utf-8')
-        driver.quit()
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
 
     # 2) Collect static URLs
+    # One walk over the tree; (el, attr, value) is kept for the rewrite in step 5
+    url_attrs = []
     static_urls = set()
-    for tag, attr in [("link","href"),("script","src"),("img","src")]:
-        for el in soup.find_all(tag):
-            v = el.get(attr)
-            if v and not v.startswith(("data:","javascript:")):
-                static_urls.add(v)
-
-    for link in soup.find_all("link", rel="stylesheet"):
-        href = link.get("href")
-        if href and not href.startswith("data:"):
-            full_css = urljoin(page_url, href)
-            try:
-                css_txt = session.get(full_css).text
-                for m in re.findall(r"url\(['\"]?(.*?)['\"]?\)", css_txt):
-                    if m and not m.startswith("data:"):
-                        static_urls.add(m)
-            except:
-                pass
+    stylesheets = []
+    for el in soup.find_all(["link","script","img","a"]):
+        attr = "src" if el.name in ("script","img") else "href"
+        v = el.get(attr)
+        if not v: continue
+        url_attrs.append((el, attr, v))
+        if el.name == "a": continue
+        # Only values starting with 'd' or 'j' can be inline data:/javascript:
+        if v[0] in "dj" and v.startswith(_INLINE_PREFIXES): continue
+        static_urls.add(v)
+        if el.name == "link" and "stylesheet" in (el.get("rel") or []):
+            stylesheets.append(v)
+
+    css_hrefs = [urljoin(page_url, href) for href in stylesheets]
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        for css_txt in ex.map(lambda u: fetch_css(session, u), css_hrefs):
+            for m in _CSS_URL_RE.finditer(css_txt):
+                v = m.group(1)
+                if not v.startswith(b"data:"):
+                    static_urls.add(v.decode("utf-8", "replace"))
 
     # 3) Collect dynamic URLs
-    dynamic_urls = get_dynamic_urls(page_url, wait_dynamic, user_agent)
+    dynamic_urls = get_dynamic_urls(page_url, wait_dynamic, browser.driver)
 
     all_urls = static_urls | dynamic_urls
     print(f"🔍 Found {len(static_urls)} static + {len(dynamic_urls)} dynamic = {len(all_urls)} total assets.")
 
-    # 4) Download everything
-    url_to_local = {}
-    for u in tqdm(all_urls, desc="Downloading assets"):
+    # 4) Download everything, linking assets already fetched for earlier pages
+    # Relative and absolute spellings of one asset (or URLs differing only in
+    # the query) resolve to the same target; keep a single writer for each
+    mapped = []
+    seen_urls = set()
+    seen_paths = set()
+    for u in sorted(all_urls):
         try:
             local_path, real_url = make_local_path(output_dir, u, page_url)
-            if download_asset(session, real_url, local_path, delay):
-                url_to_local[real_url] = local_path
         except Exception as e:
             print("⚠️", e)
+            continue
+        if real_url in seen_urls or local_path in seen_paths:
+            continue
+        seen_urls.add(real_url)
+        seen_paths.add(local_path)
+        mapped.append((local_path, real_url))
+
+    # Create each target directory once rather than once per asset; assets
+    # whose directory cannot be created are skipped
+    bad_dirs = set()
+    for d in {os.path.dirname(local_path) for local_path, _ in mapped}:
+        try:
+            os.makedirs(d, exist_ok=True)
+        except OSError as e:
+            print("⚠️", e)
+            bad_dirs.add(d)
+    if bad_dirs:
+        mapped = [m for m in mapped if os.path.dirname(m[0]) not in bad_dirs]
+
+    url_to_local = {}
+    assets = []
+    for local_path, real_url in mapped:
+        if url_cache is not None and real_url in url_cache:
+            try:
+                link_asset(url_cache[real_url], local_path)
+                url_to_local[real_url] = local_path
+            except Exception as e:
+                print("⚠️", e)
+        else:
+            assets.append((real_url, local_path))
+
+    if async_downloads:
+        downloaded = asyncio.run(download_assets_async(session, assets, delay))
+    else:
+        downloaded = download_assets(session, assets, delay, max_workers)
+    url_to_local.update(downloaded)
+    if url_cache is not None:
+        url_cache.update(downloaded)
 
     # 5) Update URLs in soup
-    for tag, attr in [("img","src"),("script","src"),("link","href"),("a","href")]:
-        for el in soup.find_all(tag):
-            v = el.get(attr)
-            if not v: continue
-            full = urljoin(page_url, v)
-            if full in url_to_local:
-                rel = os.path.relpath(url_to_local[full], output_dir).replace(os.sep, "/")
-                el[attr] = rel
+    for el, attr, v in url_attrs:
+        full = urljoin(page_url, v)
+        if full in url_to_local:
+            rel = os.path.relpath(url_to_local[full], output_dir).replace(os.sep, "/")
+            el[attr] = rel
 
     # 6) مرتب‌سازی و ذخیره نهایی HTML
     os.makedirs(output_dir, exist_ok=True)
     out_file = os.path.join(output_dir, "index.html")
 
-    # استفاده از prettify برای خوانایی بهتر HTML
-    pretty_html = soup.prettify()
-
-    with open(out_file, "w", encoding="utf-8") as f:
-        f.write(pretty_html)
+    # Serialize as-is straight to UTF-8 bytes; prettify() reformats every
+    # node in pure Python and a str copy would be re-encoded on write
+    with open(out_file, "wb") as f:
+        f.write(soup.encode("utf-8", formatter="minimal"))
 
     print(f"✅ Site saved to `{output_dir}` with {len(url_to_local)} assets.")
+    return [v for el, _, v in url_attrs if el.name == "a"]
 
 # ---------- Internal Link Crawler ----------
 
@@ -276,7 +572,9 @@ def scrape_with_crawling(
     delay=0.5,
     wait_dynamic=2.0,
     user_agent=None,
-    max_pages=10
+    max_pages=10,
+    async_downloads=False,
+    use_cache=True
 ):
     """
     Crawl and scrape multiple pages starting from a URL.
@@ -288,43 +586,65 @@ def scrape_with_crawling(
         wait_dynamic (float): Time to wait for dynamic content
         user_agent (str): Custom user agent
         max_pages (int): Maximum number of pages to crawl
+        async_downloads (bool): Download assets with asyncio + httpx instead of threads
+        use_cache (bool): Keep an HTTP cache in output_dir; disable for
+            constant-memory streaming
     """
     visited = set()
-    to_visit = [start_url]
+    to_visit = deque([start_url])
+    queued = {urldefrag(start_url)[0]}
     domain = urlparse(start_url).netloc
+    session = setup_session(user_agent=user_agent, cache_dir=output_dir if use_cache else None)
 
-    count = 0
-    while to_visit and count < max_pages:
-        current = to_visit.pop(0)
-        clean_url = urldefrag(current)[0]
-        if clean_url in visited:
-            continue
-        print(f"\n🌐 Crawling ({count+1}/{max_pages}): {clean_url}")
-        try:
-            scrape_page_combined(
-                page_url=clean_url,
-                output_dir=os.path.join(output_dir, f"page_{count+1}"),
-                delay=delay,
-                wait_dynamic=wait_dynamic,
-                user_agent=user_agent
-            )
-            visited.add(clean_url)
-            count += 1
-        except Exception as e:
-            print(f"❌ Error scraping {clean_url}: {e}")
-            continue
+    url_cache = {}
 
-        session = setup_session(user_agent=user_agent)
-        try:
-            r = session.get(clean_url, timeout=10)
-            soup = BeautifulSoup(r.content, "html.parser")
-            for a in soup.find_all("a", href=True):
-                href = urljoin(clean_url, a['href'])
-                parsed = urlparse(href)
-                if parsed.netloc == domain and urldefrag(href)[0] not in visited:
-                    to_visit.append(href)
-        except:
-            continue
+    count = 0
+    with BrowserPool(user_agent=user_agent) as browser:
+        while to_visit and count < max_pages:
+            current = to_visit.popleft()
+            clean_url = urldefrag(current)[0]
+            if clean_url in visited:
+                continue
+            print(f"\n🌐 Crawling ({count+1}/{max_pages}): {clean_url}")
+            try:
+                links = scrape_page_combined(
+                    page_url=clean_url,
+                    output_dir=os.path.join(output_dir, f"page_{count+1}"),
+                    delay=delay,
+                    wait_dynamic=wait_dynamic,
+                    user_agent=user_agent,
+                    session=session,
+                    browser=browser,
+                    async_downloads=async_downloads,
+                    url_cache=url_cache
+                )
+                visited.add(clean_url)
+                count += 1
+            except Exception as e:
+                print(f"❌ Error scraping {clean_url}: {e}")
+                continue
+
+            # Reuse the anchors from the scrape instead of fetching the page again.
+            # Absolute same-site links skip urljoin/urlparse entirely.
+            scheme = urlparse(clean_url).scheme
+            prefix = f"{scheme}://{domain}/"
+            for link in links:
+                link = link.split("#", 1)[0]
+                try:
+                    if link.startswith(prefix):
+                        href = link
+                    elif link.startswith("//"):
+                        href = f"{scheme}:{link}"
+                    else:
+                        href = urljoin(clean_url, link)
+                    if href in queued:
+                        continue
+                    if not (href.startswith(prefix) or urlparse(href).netloc == domain):
+                        continue
+                except ValueError:
+                    continue
+                to_visit.append(href)
+                queued.add(href)
 
     print(f"\n✅ Finished crawling {count} pages.")
 
@@ -340,6 +660,8 @@ if __name__ == "__main__":
     parser.add_argument("--crawl", "-c", action="store_true", help="Enable crawling")
     parser.add_argument("--max-pages", "-m", type=int, default=10, help="Maximum pages to crawl")
     parser.add_argument("--user-agent", "-u", help="Custom user agent")
+    parser.add_argument("--async-downloads", "-a", action="store_true", help="Download assets with asyncio + httpx")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the on-disk HTTP cache")
     
     args = parser.parse_args()
     
@@ -350,7 +672,9 @@ if __name__ == "__main__":
             delay=args.delay,
             wait_dynamic=args.wait,
             user_agent=args.user_agent,
-            max_pages=args.max_pages
+            max_pages=args.max_pages,
+            async_downloads=args.async_downloads,
+            use_cache=not args.no_cache
         )
     else:
         scrape_page_combined(
@@ -358,5 +682,7 @@ if __name__ == "__main__":
             output_dir=args.output,
             delay=args.delay,
             wait_dynamic=args.wait,
-            user_agent=args.user_agent
+            user_agent=args.user_agent,
+            async_downloads=args.async_downloads,
+            use_cache=not args.no_cache
         )
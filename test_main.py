@@ -0,0 +1,42 @@
+import gzip
+import http.server
+import threading
+
+import pytest
+
+import main
+
+BODY = b"console.log('asset');\n" * 2000
+
+
+class GzipHandler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        payload = gzip.compress(BODY)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/javascript")
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+@pytest.fixture
+def gzip_url():
+    srv = http.server.ThreadingHTTPServer(("127.0.0.1", 0), GzipHandler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_port}/app.js"
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_download_asset_decodes_gzip(tmp_path, gzip_url, cached):
+    session = main.setup_session(cache_dir=str(tmp_path / "cache") if cached else None)
+    # First call is a cold cache miss; second is served from the cache when enabled
+    for i in range(2):
+        local_path = tmp_path / f"app{i}.js"
+        assert main.download_asset(session, gzip_url, str(local_path), 0)
+        assert local_path.read_bytes() == BODY